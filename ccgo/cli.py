@@ -41,14 +41,16 @@ class Cli(CliCommand):
         return arr
 
     def cli(self) -> CliNameSpace:
+        # list commands directory once, used by metavar and choices
+        command_list = self.get_command_list()
         parser = argparse.ArgumentParser(
                 prog="CCGO",
                 formatter_class = argparse.RawDescriptionHelpFormatter,
                 description=self.description(),
         )
         parser.add_argument(
-            'subcommand', metavar=f"{self.get_command_list()}",
-            type=str, choices=self.get_command_list(),
+            'subcommand', metavar=f"{command_list}",
+            type=str, choices=command_list,
         )
         # parse only known args
         args, unknown = parser.parse_known_args()
@@ -75,9 +75,12 @@ class Build(CliCommand):
         print(vars(args))
         num = 2 if args.ide_project else 1
         arch = args.arch if args.target == "android" else ""
-        cmd = f"python3 build_{args.target}.py {num} {arch.replace(',', ' ')}"
+        cmd = ["python3", f"build_{args.target}.py", str(num)]
+        cmd.extend(x.strip() for x in arch.split(",") if x.strip())
         print("\nExecute command:")
-        print(cmd)
-        err_code = os.system(cmd)
+        # flush once before the child process writes to the same stdout
+        print(" ".join(cmd), flush=True)
+        # run without an intermediate shell, returns the real exit code
+        err_code = subprocess.call(cmd)
         sys.exit(err_code)
 
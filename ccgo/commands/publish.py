@@ -65,7 +65,8 @@ class Publish(CliCommand):
             sys.exit(1)
         # do publish
         cmd = f"./gradlew publishMainPublicationToMavenRepository --no-daemon --info"
-        err_code, err_msg = exec_command(cmd)
+        # gradle --info is verbose, only the tail is needed on error
+        err_code, err_msg = exec_command(cmd, tail_lines=200)
         if err_code != 0:
             print("\nEnd with error:")
             print(err_msg)
@@ -11,20 +11,24 @@
 
 import subprocess
 import time
+from collections import deque
 from threading import Timer
 
 DEFAULT_TIMEOUT_SECOND = 10
 
 
-def exec_command(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT):
+def exec_command(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                 tail_lines=None):
     # timeout is 3 hours
-    return exec_command_with_timeout_second(command, 3 * 3600)
+    return exec_command_with_timeout_second(command, 3 * 3600,
+                                            tail_lines=tail_lines)
 
 
 def exec_command_with_timeout_second(command, 
                                      timeout_second=DEFAULT_TIMEOUT_SECOND,
                                      stdout=subprocess.PIPE,
-                                     stderr=subprocess.STDOUT):
+                                     stderr=subprocess.STDOUT,
+                                     tail_lines=None):
     start_mills = int(time.time() * 1000)
     # default timeout is 10 second
     compile_popen = subprocess.Popen(
@@ -33,7 +37,14 @@ def exec_command_with_timeout_second(command,
     timer = Timer(timeout_second, lambda process: process.kill(), [compile_popen])
     try:
         timer.start()
-        stdout, stderr = compile_popen.communicate()
+        if tail_lines and stdout == subprocess.PIPE and stderr != subprocess.PIPE:
+            # only keep the last lines, do not buffer the whole output
+            tail = deque(compile_popen.stdout, maxlen=tail_lines)
+            compile_popen.stdout.close()
+            compile_popen.wait()
+            stdout, stderr = b"".join(tail), None
+        else:
+            stdout, stderr = compile_popen.communicate()
     finally:
         timer.cancel()
     err_code = compile_popen.returncode
@@ -15,7 +15,7 @@ from setuptools import setup, find_packages
 
 ALL_PROGRAM_ENTRIES = ['ccgo = ccgo.main:main']
 
-with open("README.md", "r") as f:
+with open("README.md", "r", encoding="utf-8") as f:
     long_description = f.read()
 
 setup(